@@ -0,0 +1,140 @@
+"""HTTP helpers shared by the data update scripts."""
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+
+HTTP_CACHE_DIR = os.environ.get("HTTP_CACHE_DIR", str(Path(__file__).resolve().parents[1] / ".cache"))
+
+# Text payloads (CSV, JSON) compress several-fold; bodies are inflated in decode_body.
+REQUEST_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+_pool = threading.local()
+
+
+def decode_body(body, encoding):
+    encoding = (encoding or "").strip().lower()
+    if not body:
+        # HEAD and 304 replies may still advertise the encoding of the body they omit.
+        return body
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send a raw deflate stream without the zlib header.
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def connection_for(scheme, netloc, timeout=60):
+    """Keep-alive connection for (scheme, host), one per thread."""
+    conns = getattr(_pool, "conns", None)
+    if conns is None:
+        conns = _pool.conns = {}
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conns[(scheme, netloc)] = cls(netloc, timeout=timeout)
+    elif conn.timeout != timeout:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+
+def http_request(url, method="GET", headers=None, timeout=60, redirects=5):
+    """Issue a request over a pooled connection and return (status, headers, body).
+
+    Raises urllib's HTTPError on 4xx/5xx so callers can keep matching on `exc.code`.
+    """
+    parts = urlsplit(url)
+    target = parts.path + ("?" + parts.query if parts.query else "")
+    for attempt in range(2):
+        conn = connection_for(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request(method, target, headers={**REQUEST_HEADERS, **(headers or {})})
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except (http.client.HTTPException, ConnectionError):
+            # The server may have dropped an idle keep-alive socket; reconnect once.
+            conn.close()
+            if attempt:
+                raise
+    body = decode_body(body, resp.getheader("Content-Encoding"))
+    location = resp.getheader("Location")
+    if resp.status in (301, 302, 303, 307, 308) and location and redirects:
+        if resp.status == 303 and method != "HEAD":
+            # "See Other" points at a resource to retrieve, whatever the original method was.
+            method = "GET"
+        return http_request(urljoin(url, location), method, headers, timeout, redirects - 1)
+    if resp.status >= 400:
+        raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    return resp.status, resp.headers, body
+
+
+def cache_paths(url):
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    root = Path(HTTP_CACHE_DIR)
+    return root / f"{key}.body", root / f"{key}.meta.json"
+
+
+def write_atomic(path, data):
+    """Replace `path` with `data` so readers never observe a partially written file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def conditional_get(url, headers=None, ttl=None, timeout=60):
+    """GET `url`, revalidating a cached copy with If-None-Match / If-Modified-Since.
+
+    Returns (body, modified); `modified` is False when the cached body was reused. A cached
+    body fetched less than `ttl` seconds ago is returned without touching the network.
+    """
+    if not HTTP_CACHE_DIR:
+        return http_request(url, headers=headers, timeout=timeout)[2], True
+    body_path, meta_path = cache_paths(url)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        cached = body_path.read_bytes()
+    except (OSError, ValueError):
+        meta, cached = {}, None
+    now = time.time()
+    if cached is not None and ttl is not None and now - meta.get("fetched_at", 0) < ttl:
+        return cached, False
+    headers = dict(headers or {})
+    if cached is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    status, resp_headers, body = http_request(url, headers=headers, timeout=timeout)
+    modified = not (status == 304 and cached is not None)
+    if not modified:
+        body = cached
+    else:
+        meta = {"etag": resp_headers.get("ETag"), "last_modified": resp_headers.get("Last-Modified")}
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop the old validators first: if we stop before the new meta lands, the next run
+        # does a plain GET instead of revalidating the new body against a stale ETag.
+        meta_path.unlink(missing_ok=True)
+        write_atomic(body_path, body)
+    meta["fetched_at"] = now
+    write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+    return body, modified
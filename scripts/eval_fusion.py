@@ -1,14 +1,30 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import csv
+import hashlib
+import heapq
 import json
 import math
+import os
+import pickle
+import tempfile
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import compress
+from operator import itemgetter, mul
 from pathlib import Path
 
 TARGET_BASE = "US_CONUS_FEBMAR_MEAN_ANOM"
 TARGET_MARCH = "US_CONUS_MAR_ANOM"
 MIN_BACKTEST_GH = 20
 
+FUSION_WORKERS = int(os.environ.get("FUSION_WORKERS", "0")) or None
+# Anchored at the repo root so runs from any working directory share one cache; empty disables.
+FUSION_CACHE_DIR = os.environ.get("FUSION_CACHE_DIR", str(Path(__file__).resolve().parents[1] / ".cache"))
+
 GOAL_ACCURACY = 0.70
 
 FUSION_CONFIGS = [
@@ -168,7 +184,7 @@ TUNING_SETS = [
         "minConfigYears": 8,
         "rankWindowYears": 24,
         "rankDecayHalfLife": 12,
-        "stack": {"steps": 260, "lr": 0.22, "l2": 0.06, "minTrain": 12, "decayHalfLife": 12, "windowYears": 30},
+        "stack": {"steps": 260, "warmStartSteps": 65, "lr": 0.22, "l2": 0.06, "minTrain": 12, "decayHalfLife": 12, "windowYears": 30},
         "blend": {"minTrain": 8, "windowYears": 26, "decayHalfLife": 10, "stabilityBoost": 0.8},
     },
     {
@@ -180,7 +196,7 @@ TUNING_SETS = [
         "minConfigYears": 6,
         "rankWindowYears": 18,
         "rankDecayHalfLife": 8,
-        "stack": {"steps": 300, "lr": 0.26, "l2": 0.05, "minTrain": 10, "decayHalfLife": 8, "windowYears": 20},
+        "stack": {"steps": 300, "warmStartSteps": 75, "lr": 0.26, "l2": 0.05, "minTrain": 10, "decayHalfLife": 8, "windowYears": 20},
         "blend": {"minTrain": 7, "windowYears": 16, "decayHalfLife": 6, "stabilityBoost": 0.5},
     },
     {
@@ -192,7 +208,7 @@ TUNING_SETS = [
         "minConfigYears": 10,
         "rankWindowYears": 32,
         "rankDecayHalfLife": 16,
-        "stack": {"steps": 240, "lr": 0.18, "l2": 0.08, "minTrain": 14, "decayHalfLife": 16, "windowYears": 35},
+        "stack": {"steps": 240, "warmStartSteps": 60, "lr": 0.18, "l2": 0.08, "minTrain": 14, "decayHalfLife": 16, "windowYears": 35},
         "blend": {"minTrain": 9, "windowYears": 30, "decayHalfLife": 14, "stabilityBoost": 1.1},
     },
     {
@@ -204,7 +220,7 @@ TUNING_SETS = [
         "minConfigYears": 6,
         "rankWindowYears": 12,
         "rankDecayHalfLife": 4,
-        "stack": {"steps": 280, "lr": 0.24, "l2": 0.05, "minTrain": 9, "decayHalfLife": 6, "windowYears": 12},
+        "stack": {"steps": 280, "warmStartSteps": 70, "lr": 0.24, "l2": 0.05, "minTrain": 9, "decayHalfLife": 6, "windowYears": 12},
         "blend": {"minTrain": 7, "windowYears": 10, "decayHalfLife": 4, "stabilityBoost": 0.3},
     },
     {
@@ -216,7 +232,7 @@ TUNING_SETS = [
         "minConfigYears": 12,
         "rankWindowYears": 40,
         "rankDecayHalfLife": 20,
-        "stack": {"steps": 220, "lr": 0.16, "l2": 0.1, "minTrain": 16, "decayHalfLife": 20, "windowYears": 40},
+        "stack": {"steps": 220, "warmStartSteps": 55, "lr": 0.16, "l2": 0.1, "minTrain": 16, "decayHalfLife": 20, "windowYears": 40},
         "blend": {"minTrain": 10, "windowYears": 35, "decayHalfLife": 18, "stabilityBoost": 1.2},
     },
 ]
@@ -224,17 +240,12 @@ TUNING_SETS = [
 
 def parse_csv(text: str) -> list[dict]:
     lines = [line for line in text.splitlines() if line.strip() and not line.strip().startswith("#")]
-    if not lines:
+    reader = csv.reader(lines)
+    headers = [h.strip() for h in next(reader, [])]
+    if not headers:
         return []
-    headers = [h.strip() for h in lines[0].split(",")]
-    rows = []
-    for line in lines[1:]:
-        parts = line.split(",")
-        row = {}
-        for i, header in enumerate(headers):
-            row[header] = (parts[i] if i < len(parts) else "").strip()
-        rows.append(row)
-    return rows
+    pad = [""] * len(headers)
+    return [dict(zip(headers, map(str.strip, parts + pad[len(parts):]))) for parts in reader]
 
 
 def build_outcome_rows(outcomes_rows: list[dict]) -> list[dict]:
@@ -269,8 +280,8 @@ def normalize_outcome(x: str) -> str:
     return ""
 
 
-def index_outcomes(outcome_rows: list[dict]) -> dict[str, str]:
-    out = {}
+def index_outcomes(outcome_rows: list[dict]) -> dict[str, dict[int, str]]:
+    out: dict[str, dict[int, str]] = {}
     for r in outcome_rows:
         try:
             year = int(float(r.get("year", "")))
@@ -280,12 +291,16 @@ def index_outcomes(outcome_rows: list[dict]) -> dict[str, str]:
         outcome = normalize_outcome(r.get("outcome", ""))
         if not target or not outcome:
             continue
-        out[f"{target}:{year}"] = outcome
+        out.setdefault(target, {})[year] = outcome
     return out
 
 
-def index_predictions(pred_obj: dict) -> dict[int, list[dict]]:
-    by_year: dict[int, list[dict]] = {}
+def index_predictions(pred_obj: dict) -> dict[int, tuple[list[int], list[bool]]]:
+    """Group predictions by year into parallel (slug id, shadow) lists, each year ordered by slug.
+
+    Slug ids are assigned in order of first appearance, walking years ascending.
+    """
+    rows: dict[int, list[tuple[str, bool]]] = {}
     for p in pred_obj.get("predictions", []):
         try:
             year = int(float(p.get("year", "")))
@@ -294,37 +309,64 @@ def index_predictions(pred_obj: dict) -> dict[int, list[dict]]:
         slug = p.get("groundhogSlug")
         if not slug:
             continue
-        by_year.setdefault(year, []).append(p)
-    for arr in by_year.values():
-        arr.sort(key=lambda p: str(p.get("groundhogSlug")))
+        rows.setdefault(year, []).append((str(slug), bool(p.get("shadow"))))
+    slug_ids: dict[str, int] = {}
+    by_year: dict[int, tuple[list[int], list[bool]]] = {}
+    for year in sorted(rows):
+        arr = sorted(rows[year], key=itemgetter(0))
+        by_year[year] = ([slug_ids.setdefault(slug, len(slug_ids)) for slug, _ in arr], [shadow for _, shadow in arr])
     return by_year
 
 
+def index_prediction_columns(pred_by_year: dict[int, tuple[list[int], list[bool]]]) -> dict:
+    """Flatten the per-year prediction lists into parallel year-sorted columns."""
+    slug_col: list[int] = []
+    year_col: list[int] = []
+    shadow_col: list[bool] = []
+    for year in sorted(pred_by_year.keys()):
+        slug_ids, shadows = pred_by_year[year]
+        slug_col.extend(slug_ids)
+        year_col.extend([year] * len(slug_ids))
+        shadow_col.extend(shadows)
+    return {
+        "slugCount": max(slug_col) + 1 if slug_col else 0,
+        "slugId": slug_col,
+        "year": year_col,
+        "shadow": shadow_col,
+        "yearSet": set(year_col),
+    }
+
+
 def prediction_to_outcome(shadow: bool) -> str:
     return "LONG_WINTER" if shadow else "EARLY_SPRING"
 
 
-def has_min_groundhogs(pred_by_year: dict[int, list[dict]], year: int, min_count: int = MIN_BACKTEST_GH) -> bool:
-    return len(pred_by_year.get(year, [])) >= min_count
+def has_min_groundhogs(pred_by_year: dict[int, tuple[list[int], list[bool]]], year: int, min_count: int = MIN_BACKTEST_GH) -> bool:
+    return year in pred_by_year and len(pred_by_year[year][0]) >= min_count
 
 
-def majority_vote(preds: list[dict]) -> dict:
-    early = 0
-    late = 0
-    for p in preds:
-        out = prediction_to_outcome(bool(p.get("shadow")))
-        if out == "EARLY_SPRING":
-            early += 1
-        else:
-            late += 1
-    used = early + late
+def majority_vote(shadow_flags: list[bool]) -> dict:
+    used = len(shadow_flags)
     if not used:
         return {"pred": "", "certainty": float("nan"), "used": 0}
+    late = sum(shadow_flags)
+    early = used - late
     pred = "EARLY_SPRING" if early >= late else "LONG_WINTER"
     certainty = max(early, late) / used
     return {"pred": pred, "certainty": certainty, "used": used}
 
 
+def majority_votes(columns: dict) -> dict[int, dict]:
+    """majority_vote for every year at once, slicing each year's run out of the year-sorted columns."""
+    shadow = columns["shadow"]
+    votes = {}
+    start = 0
+    for year, used in Counter(columns["year"]).items():
+        votes[year] = majority_vote(shadow[start:start + used])
+        start += used
+    return votes
+
+
 def clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
@@ -334,148 +376,221 @@ def logit(p: float) -> float:
     return math.log(q / (1 - q))
 
 
-def compute_fusion_stats(pred_by_year: dict[int, list[dict]], outcomes: dict[str, str], target: str, year_exclusive: int, cfg: dict):
-    years = sorted([y for y in pred_by_year.keys() if y < year_exclusive and f"{target}:{y}" in outcomes])
-    stats: dict[str, dict] = {}
-    if not years:
-        return {"stats": {}, "maxN": 0}
-
-    split_year = years[len(years) // 2]
-    lambda_decay = math.log(2) / max(1e-9, cfg.get("halfLifeYears", 1)) if cfg.get("halfLifeYears") else None
-    window_start = year_exclusive - cfg.get("windowYears", 0) if cfg.get("windowYears") else None
-    max_n = 0
+def precompute_slug_history(columns: dict, outcome_by_year: dict[int, str]) -> dict:
+    """Per-slug scored years and correctness for one target, shared by every config.
+
+    Bit i of a slug's present/correct mask stands for the i-th scored year. Repeated rows for
+    the same slug and year are still counted, as the site does: each extra copy sets its bit in
+    an additional (present, correct) layer under `extraMasks[slug_id]`.
+    """
+    n_slugs = columns["slugCount"]
+    years = sorted(y for y in columns["yearSet"] if y in outcome_by_year)
+    bit_of = {y: 1 << i for i, y in enumerate(years)}
+    slug_years: list[list[int]] = [[] for _ in range(n_slugs)]
+    slug_correct: list[list[bool]] = [[] for _ in range(n_slugs)]
+    present_masks = [0] * n_slugs
+    correct_masks = [0] * n_slugs
+    extra_masks: dict[int, list[list[int]]] = {}
+    for slug_id, year, shadow in zip(columns["slugId"], columns["year"], columns["shadow"]):
+        bit = bit_of.get(year)
+        if bit is None:
+            continue
+        correct = prediction_to_outcome(shadow) == outcome_by_year[year]
+        slug_years[slug_id].append(year)
+        slug_correct[slug_id].append(correct)
+        if present_masks[slug_id] & bit:
+            layers = extra_masks.setdefault(slug_id, [])
+            layer = next((m for m in layers if not m[0] & bit), None)
+            if layer is None:
+                layer = [0, 0]
+                layers.append(layer)
+            layer[0] |= bit
+            if correct:
+                layer[1] |= bit
+            continue
+        present_masks[slug_id] |= bit
+        if correct:
+            correct_masks[slug_id] |= bit
+    return {
+        "years": years,
+        "slugYears": slug_years,
+        "slugCorrect": slug_correct,
+        "presentMasks": present_masks,
+        "correctMasks": correct_masks,
+        "extraMasks": extra_masks,
+        "majority": majority_votes(columns),
+        "maxAge": max(columns["yearSet"]) - years[0] if years else 0,
+        "counts": {},
+    }
 
-    for year in years:
-        actual = outcomes.get(f"{target}:{year}")
-        preds = pred_by_year.get(year, [])
-        age = year_exclusive - year
-        decay_w = math.exp(-lambda_decay * age) if lambda_decay is not None else 1.0
-        in_window = year >= window_start if window_start is not None else True
-
-        for p in preds:
-            slug = p.get("groundhogSlug")
-            if not slug:
-                continue
-            s = stats.setdefault(slug, {
-                "n": 0,
-                "k": 0,
-                "nDecay": 0.0,
-                "kDecay": 0.0,
-                "nWindow": 0,
-                "kWindow": 0,
-                "nEarly": 0,
-                "kEarly": 0,
-                "nLate": 0,
-                "kLate": 0,
-            })
-            pred_out = prediction_to_outcome(bool(p.get("shadow")))
-            correct = pred_out == actual
 
-            s["n"] += 1
-            if correct:
-                s["k"] += 1
-            s["nDecay"] += decay_w
-            if correct:
-                s["kDecay"] += decay_w
-            if in_window:
-                s["nWindow"] += 1
-                if correct:
-                    s["kWindow"] += 1
-            if year < split_year:
-                s["nEarly"] += 1
-                if correct:
-                    s["kEarly"] += 1
-            else:
-                s["nLate"] += 1
-                if correct:
-                    s["kLate"] += 1
-            if s["n"] > max_n:
-                max_n = s["n"]
-
-    derived = {}
-    for slug, s in stats.items():
-        if not s["n"]:
+@lru_cache(maxsize=None)
+def decay_weights(half_life, max_age: int) -> tuple[float, ...]:
+    """exp(-ln2 / half_life * age) for ages 0..max_age, or all ones when decay is off."""
+    if not half_life:
+        return (1.0,) * (max_age + 1)
+    lambda_decay = math.log(2) / max(1e-9, half_life)
+    return tuple(math.exp(-lambda_decay * age) for age in range(max_age + 1))
+
+
+def year_mask(years: list[int], start: int | None, stop: int) -> int:
+    """Bitmask over the positions of sorted `years` that fall in [start, stop)."""
+    lo = bisect_left(years, start) if start is not None else 0
+    hi = bisect_left(years, stop)
+    return ((1 << hi) - 1) ^ ((1 << lo) - 1) if hi > lo else 0
+
+
+def history_counts(history: dict, year_exclusive: int) -> dict:
+    """Config-independent per-slug counts before `year_exclusive`, memoized on the history."""
+    cached = history["counts"].get(year_exclusive)
+    if cached is not None:
+        return cached
+    years = history["years"]
+    cut = bisect_left(years, year_exclusive)
+    prior = (1 << cut) - 1
+    early = (1 << (cut // 2)) - 1
+    extra_masks = history["extraMasks"]
+    slugs = []
+    for slug_id, (present, correct) in enumerate(zip(history["presentMasks"], history["correctMasks"])):
+        n = (present & prior).bit_count()
+        if not n:
             continue
-        prior_a = cfg.get("priorA", 2)
-        prior_b = cfg.get("priorB", 2)
-        acc_raw = s["k"] / s["n"]
-        acc_bayes = (s["k"] + prior_a) / (s["n"] + prior_a + prior_b)
-        acc_decay = (s["kDecay"] + prior_a) / (s["nDecay"] + prior_a + prior_b) if s["nDecay"] else acc_bayes
-        acc_window = (s["kWindow"] + prior_a) / (s["nWindow"] + prior_a + prior_b) if s["nWindow"] else acc_bayes
-        acc_early = s["kEarly"] / s["nEarly"] if s["nEarly"] else acc_raw
-        acc_late = s["kLate"] / s["nLate"] if s["nLate"] else acc_raw
-        stability = clamp(1 - abs(acc_early - acc_late), 0, 1)
-        trend = acc_late - acc_early
-        derived[slug] = {
-            "n": s["n"],
-            "accRaw": acc_raw,
-            "accBayes": acc_bayes,
-            "accDecay": acc_decay,
-            "accWindow": acc_window,
-            "stability": stability,
-            "trend": trend,
-        }
-
-    return {"stats": derived, "maxN": max_n}
-
-
-def build_fusion_weights(stats: dict, max_n: int, cfg: dict) -> dict[str, float]:
-    weights: dict[str, float] = {}
+        k = (correct & prior).bit_count()
+        n_early = (present & early).bit_count()
+        k_early = (correct & early).bit_count()
+        for dup_present, dup_correct in extra_masks.get(slug_id, ()):
+            n += (dup_present & prior).bit_count()
+            k += (dup_correct & prior).bit_count()
+            n_early += (dup_present & early).bit_count()
+            k_early += (dup_correct & early).bit_count()
+        slugs.append((slug_id, n, k, n_early, k_early))
+    counts = {"years": years[:cut], "slugs": slugs}
+    history["counts"][year_exclusive] = counts
+    return counts
+
+
+def compute_fusion_stats(history: dict, year_exclusive: int, cfg: dict):
+    """Per-slug accuracy features before `year_exclusive`, as parallel columns over slugs with history."""
+    stats = {"slugId": [], "n": [], "accBayes": [], "accDecay": [], "accWindow": [], "stability": [], "trend": []}
+    counts = history_counts(history, year_exclusive)
+    if not counts["years"]:
+        return {"stats": stats, "maxN": 0}
+
+    decay = decay_weights(cfg.get("halfLifeYears"), history["maxAge"])
+    window_start = year_exclusive - cfg.get("windowYears", 0) if cfg.get("windowYears") else None
+    window = year_mask(history["years"], window_start, year_exclusive)
+    prior_a = cfg.get("priorA", 2)
+    prior_b = cfg.get("priorB", 2)
+    slug_years = history["slugYears"]
+    slug_correct = history["slugCorrect"]
+    present_masks = history["presentMasks"]
+    correct_masks = history["correctMasks"]
+    extra_masks = history["extraMasks"]
+    slug_id_col = stats["slugId"]
+    n_col = stats["n"]
+    acc_bayes_col = stats["accBayes"]
+    acc_decay_col = stats["accDecay"]
+    acc_window_col = stats["accWindow"]
+    stability_col = stats["stability"]
+    trend_col = stats["trend"]
+
+    max_n = 0
+    for slug_id, n, k, n_early, k_early in counts["slugs"]:
+        decay_w = [decay[year_exclusive - y] for y in slug_years[slug_id][:n]]
+        n_decay = sum(decay_w, 0.0)
+        k_decay = sum(compress(decay_w, slug_correct[slug_id]), 0.0)
+        n_window = (present_masks[slug_id] & window).bit_count()
+        k_window = (correct_masks[slug_id] & window).bit_count()
+        for dup_present, dup_correct in extra_masks.get(slug_id, ()):
+            n_window += (dup_present & window).bit_count()
+            k_window += (dup_correct & window).bit_count()
+        n_late = n - n_early
+        k_late = k - k_early
+
+        acc_raw = k / n
+        acc_bayes = (k + prior_a) / (n + prior_a + prior_b)
+        acc_early = k_early / n_early if n_early else acc_raw
+        acc_late = k_late / n_late if n_late else acc_raw
+        slug_id_col.append(slug_id)
+        n_col.append(n)
+        acc_bayes_col.append(acc_bayes)
+        acc_decay_col.append((k_decay + prior_a) / (n_decay + prior_a + prior_b) if n_decay else acc_bayes)
+        acc_window_col.append((k_window + prior_a) / (n_window + prior_a + prior_b) if n_window else acc_bayes)
+        stability_col.append(clamp(1 - abs(acc_early - acc_late), 0, 1))
+        trend_col.append(acc_late - acc_early)
+        if n > max_n:
+            max_n = n
+
+    return {"stats": stats, "maxN": max_n}
+
+
+def build_fusion_weights(stats: dict, max_n: int, cfg: dict) -> dict[int, float]:
+    weights: dict[int, float] = {}
     denom = math.log1p(max(1, max_n))
-    for slug, s in stats.items():
-        if s["n"] < cfg.get("minObs", 0):
+    min_obs = cfg.get("minObs", 0)
+    w_bayes = cfg.get("wBayes", 1)
+    w_decay = cfg.get("wDecay", 0)
+    w_window = cfg.get("wWindow", 0)
+    w_stability = cfg.get("wStability", 0)
+    w_evidence = cfg.get("wEvidence", 0)
+    w_trend = cfg.get("wTrend", 0)
+    contrarian = cfg.get("contrarian")
+    n_boost = cfg.get("nBoost", 0.5)
+    log1p = math.log1p
+    isfinite = math.isfinite
+    for slug_id, n, acc_bayes, acc_decay, acc_window, stability, trend in zip(
+        stats["slugId"], stats["n"], stats["accBayes"], stats["accDecay"], stats["accWindow"], stats["stability"], stats["trend"]
+    ):
+        if n < min_obs:
             continue
-        evidence = math.log1p(s["n"]) / denom if denom else 0
-        stability = s["stability"] if math.isfinite(s["stability"]) else 0.5
+        evidence = log1p(n) / denom if denom else 0
+        stability = stability if isfinite(stability) else 0.5
         signal = (
-            cfg.get("wBayes", 1) * logit(s["accBayes"])
-            + cfg.get("wDecay", 0) * logit(s["accDecay"])
-            + cfg.get("wWindow", 0) * logit(s["accWindow"])
-            + cfg.get("wStability", 0) * ((stability - 0.5) * 2)
-            + cfg.get("wEvidence", 0) * evidence
-            + cfg.get("wTrend", 0) * s["trend"]
+            w_bayes * logit(acc_bayes)
+            + w_decay * logit(acc_decay)
+            + w_window * logit(acc_window)
+            + w_stability * ((stability - 0.5) * 2)
+            + w_evidence * evidence
+            + w_trend * trend
         )
-        if not math.isfinite(signal):
+        if not isfinite(signal):
             continue
         w = signal
-        if cfg.get("contrarian") and s["accBayes"] < 0.5:
+        if contrarian and acc_bayes < 0.5:
             w *= -1
-        boost = math.pow(max(1, s["n"]), cfg.get("nBoost", 0.5))
-        w *= boost
+        w *= math.pow(max(1, n), n_boost)
         if abs(w) < 1e-9:
             continue
-        weights[slug] = w
+        weights[slug_id] = w
     sum_abs = sum(abs(x) for x in weights.values())
     if not sum_abs:
         return {}
-    return {slug: w / sum_abs for slug, w in weights.items()}
+    return {slug_id: w / sum_abs for slug_id, w in weights.items()}
 
 
-def predict_with_fusion_config(pred_by_year, outcomes, target, year, cfg, cache):
+def predict_with_fusion_config(pred_by_year, history, year, cfg, cache):
     key = f"{cfg['id']}:{year}"
     if key in cache:
         return cache[key]
-    preds = pred_by_year.get(year, [])
-    if not preds:
+    slug_ids, shadows = pred_by_year.get(year, ((), ()))
+    if not slug_ids:
         empty = {"pred": "", "certainty": float("nan"), "used": 0, "usedWeighted": False}
         cache[key] = empty
         return empty
-    stats_res = compute_fusion_stats(pred_by_year, outcomes, target, year, cfg)
+    stats_res = compute_fusion_stats(history, year, cfg)
     weights = build_fusion_weights(stats_res["stats"], stats_res["maxN"], cfg)
     score = 0.0
     total_abs = 0.0
     used = 0
-    for p in preds:
-        w = weights.get(p.get("groundhogSlug"))
+    for slug_id, shadow in zip(slug_ids, shadows):
+        w = weights.get(slug_id)
         if w is None:
             continue
-        out = prediction_to_outcome(bool(p.get("shadow")))
-        vote = 1 if out == "EARLY_SPRING" else -1
-        score += w * vote
+        score += -w if shadow else w
         total_abs += abs(w)
         used += 1
     if not total_abs:
-        fallback = majority_vote(preds)
+        fallback = history["majority"].get(year) or majority_vote(shadows)
         res = {**fallback, "usedWeighted": False}
     else:
         pred = "EARLY_SPRING" if score >= 0 else "LONG_WINTER"
@@ -485,6 +600,20 @@ def predict_with_fusion_config(pred_by_year, outcomes, target, year, cfg, cache)
     return res
 
 
+def parallel_map(fn, items: list) -> list:
+    """Map `fn` over `items` in worker processes, preserving order; one effective worker runs inline."""
+    workers = min(FUSION_WORKERS or os.cpu_count() or 1, len(items))
+    if workers < 2:
+        return [fn(item) for item in items]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items))
+
+
+def predict_config_years(pred_by_year, history, years, cfg):
+    cache = {}
+    return [predict_with_fusion_config(pred_by_year, history, y, cfg, cache) for y in years]
+
+
 def signal_from_prediction(res: dict):
     if not res or not res.get("pred"):
         return {"signal": 0, "strength": 0}
@@ -496,55 +625,86 @@ def signal_from_prediction(res: dict):
 
 def build_fusion_feature_cache(pred_by_year, outcomes, target, configs, min_groundhogs):
     all_years = sorted(pred_by_year.keys())
-    scored_years = [y for y in all_years if f"{target}:{y}" in outcomes and has_min_groundhogs(pred_by_year, y, min_groundhogs)]
-    results_by_year = {}
-    pred_cache = {}
+    outcome_by_year = outcomes.get(target, {})
+    scored_years = [y for y in all_years if y in outcome_by_year and has_min_groundhogs(pred_by_year, y, min_groundhogs)]
+    history = precompute_slug_history(index_prediction_columns(pred_by_year), outcome_by_year)
+    # Fill the shared counts up front so every worker receives them instead of recomputing.
     for y in all_years:
-        results_by_year[y] = [predict_with_fusion_config(pred_by_year, outcomes, target, y, cfg, pred_cache) for cfg in configs]
-    labels_by_year = {}
-    for y in scored_years:
-        out = outcomes.get(f"{target}:{y}")
-        labels_by_year[y] = 1 if out == "EARLY_SPRING" else 0
+        history_counts(history, y)
+    by_config = parallel_map(partial(predict_config_years, pred_by_year, history, all_years), configs)
+    results_by_year = {y: [results[i] for results in by_config] for i, y in enumerate(all_years)}
+    signals_by_year = {}
+    for y, results in results_by_year.items():
+        signals_by_year[y] = [(sig["signal"], sig["strength"]) for sig in map(signal_from_prediction, results)]
+    labels_by_year = {y: 1 if outcome_by_year[y] == "EARLY_SPRING" else 0 for y in scored_years}
     return {
         "target": target,
         "configs": configs,
         "allYears": all_years,
         "scoredYears": scored_years,
         "resultsByYear": results_by_year,
+        "signalsByYear": signals_by_year,
         "labelsByYear": labels_by_year,
+        "perfPrefix": {},
     }
 
 
+def window_scored_years(feature_cache, year, window_years):
+    """Scored years in [year - window_years, year), sliced from the sorted scoredYears by bisection."""
+    years = feature_cache["scoredYears"]
+    lo = bisect_left(years, year - window_years) if window_years else 0
+    return years[lo:bisect_left(years, year)]
+
+
+def config_prefix_sums(feature_cache, config_index, decay_half_life):
+    """Cumulative (k, n) for one config over scoredYears, memoized per decay half-life.
+
+    Decay weights are anchored at the last scored year; callers rescale to their own current year.
+    """
+    key = (config_index, decay_half_life)
+    cached = feature_cache["perfPrefix"].get(key)
+    if cached is not None:
+        return cached
+    years = feature_cache["scoredYears"]
+    anchor = years[-1] if years else 0
+    decay = decay_weights(decay_half_life, anchor - years[0] if years else 0)
+    k_prefix = [0.0]
+    n_prefix = [0.0]
+    for y in years:
+        res = feature_cache["resultsByYear"].get(y, [None])[config_index]
+        weight = 0.0
+        hit = 0.0
+        if res and res.get("pred"):
+            weight = decay[anchor - y]
+            actual = "EARLY_SPRING" if feature_cache["labelsByYear"].get(y) == 1 else "LONG_WINTER"
+            if res["pred"] == actual:
+                hit = weight
+        k_prefix.append(k_prefix[-1] + hit)
+        n_prefix.append(n_prefix[-1] + weight)
+    feature_cache["perfPrefix"][key] = (k_prefix, n_prefix)
+    return k_prefix, n_prefix
+
+
 def config_performance(feature_cache, config_index, train_years, opts):
-    k = 0.0
-    n = 0.0
-    k_early = 0.0
-    n_early = 0.0
-    k_late = 0.0
-    n_late = 0.0
+    """Decayed accuracy of one config over `train_years`, a contiguous run of scoredYears."""
     current_year = opts.get("currentYear", max(train_years))
-    lambda_decay = math.log(2) / max(1e-9, opts.get("decayHalfLife", 0)) if opts.get("decayHalfLife") else None
-    split_year = train_years[len(train_years) // 2]
-
-    for y in train_years:
-        res = feature_cache["resultsByYear"].get(y, [None])[config_index]
-        if not res or not res.get("pred"):
-            continue
-        actual = "EARLY_SPRING" if feature_cache["labelsByYear"].get(y) == 1 else "LONG_WINTER"
-        correct = res["pred"] == actual
-        age = current_year - y
-        weight = math.exp(-lambda_decay * age) if lambda_decay is not None else 1.0
-        n += weight
-        if correct:
-            k += weight
-        if y < split_year:
-            n_early += weight
-            if correct:
-                k_early += weight
-        else:
-            n_late += weight
-            if correct:
-                k_late += weight
+    decay_half_life = opts.get("decayHalfLife")
+    k_prefix, n_prefix = config_prefix_sums(feature_cache, config_index, decay_half_life)
+    years = feature_cache["scoredYears"]
+    lo = bisect_left(years, train_years[0])
+    mid = lo + len(train_years) // 2
+    hi = lo + len(train_years)
+    if decay_half_life:
+        scale = math.exp(-(math.log(2) / max(1e-9, decay_half_life)) * (current_year - years[-1]))
+    else:
+        scale = 1.0
+
+    k_early = (k_prefix[mid] - k_prefix[lo]) * scale
+    n_early = (n_prefix[mid] - n_prefix[lo]) * scale
+    k_late = (k_prefix[hi] - k_prefix[mid]) * scale
+    n_late = (n_prefix[hi] - n_prefix[mid]) * scale
+    k = (k_prefix[hi] - k_prefix[lo]) * scale
+    n = (n_prefix[hi] - n_prefix[lo]) * scale
     acc = k / n if n else float("nan")
     acc_early = k_early / n_early if n_early else acc
     acc_late = k_late / n_late if n_late else acc
@@ -553,8 +713,7 @@ def config_performance(feature_cache, config_index, train_years, opts):
 
 
 def select_top_config_indexes(feature_cache, year, cfg):
-    window_start = year - cfg.get("rankWindowYears") if cfg.get("rankWindowYears") else None
-    train_years = [y for y in feature_cache["scoredYears"] if y < year and (window_start is None or y >= window_start)]
+    train_years = window_scored_years(feature_cache, year, cfg.get("rankWindowYears"))
     if not train_years:
         return list(range(len(feature_cache["configs"])))
     scored = []
@@ -571,28 +730,17 @@ def select_top_config_indexes(feature_cache, year, cfg):
         scored.append({"idx": idx, "score": p, "n": perf["n"]})
     if not scored:
         return list(range(len(feature_cache["configs"])))
-    scored.sort(key=lambda s: (-s["score"], -s["n"]))
     top_k = max(1, min(cfg.get("topK", len(scored)), len(scored)))
-    return [s["idx"] for s in scored[:top_k]]
+    return [s["idx"] for s in heapq.nsmallest(top_k, scored, key=lambda s: (-s["score"], -s["n"]))]
 
 
-def build_feature_vector(feature_cache, year, config_idxs):
-    results = feature_cache["resultsByYear"].get(year, [])
-    feats = []
-    used = 0
-    sum_signal = 0.0
-    sum_strength = 0.0
-    sum_abs_strength = 0.0
-    for idx in config_idxs:
-        res = results[idx] if idx < len(results) else None
-        sig = signal_from_prediction(res)
-        if sig["signal"] != 0:
-            used += 1
-        sum_signal += sig["signal"]
-        sum_strength += sig["strength"]
-        sum_abs_strength += abs(sig["strength"])
-        feats.extend([sig["signal"], sig["strength"]])
-    used_ratio = used / len(config_idxs) if config_idxs else 0
+def _feature_row(picked, n_configs):
+    feats = [x for pair in picked for x in pair]
+    used = sum(1 for sign, _ in picked if sign)
+    sum_signal = sum(sign for sign, _ in picked)
+    sum_strength = sum(strength for _, strength in picked)
+    sum_abs_strength = sum(abs(strength) for _, strength in picked)
+    used_ratio = used / n_configs if n_configs else 0
     mean_signal = sum_signal / used if used else 0
     mean_strength = sum_strength / used if used else 0
     mean_abs_strength = sum_abs_strength / used if used else 0
@@ -602,67 +750,92 @@ def build_feature_vector(feature_cache, year, config_idxs):
     return feats, used
 
 
-def train_logistic(features, labels, opts):
-    steps = opts.get("steps", 200)
-    lr = opts.get("lr", 0.2)
-    l2 = opts.get("l2", 0.01)
-    if not features:
-        return None
-    m = len(features[0])
-    if not m:
-        return None
-    w = [0.0] * m
-    b = 0.0
-    n = len(features)
-    sample_weights = opts.get("sampleWeights")
-    weight_sum = sum(sample_weights) if sample_weights else n
+def build_feature_vector(feature_cache, year, config_idxs):
+    signals = feature_cache["signalsByYear"].get(year, ())
+    picked = [signals[idx] if idx < len(signals) else (0, 0) for idx in config_idxs]
+    return _feature_row(picked, len(config_idxs))
+
+
+def build_feature_matrix(feature_cache, years, config_idxs):
+    """Feature rows for the given scored years; each year's config signals are picked in a single C call."""
+    if not config_idxs:
+        return [_feature_row([], 0) for _ in years]
+    pick = itemgetter(*config_idxs)
+    signals_by_year = feature_cache["signalsByYear"]
+    if len(config_idxs) == 1:
+        picked_rows = [[pick(signals_by_year[y])] for y in years]
+    else:
+        picked_rows = [pick(signals_by_year[y]) for y in years]
+    return [_feature_row(picked, len(config_idxs)) for picked in picked_rows]
+
+
+@lru_cache(maxsize=None)
+def specialized_dot(m: int):
+    """Unrolled dot product for length-`m` vectors, generated once per feature width."""
+    body = " + ".join(f"w[{j}] * x[{j}]" for j in range(m)) or "0.0"
+    namespace: dict = {}
+    exec(f"def dot(w, x):\n    return {body}\n", namespace)
+    return namespace["dot"]
+
+
+def _train_logistic_kernel(features, labels, sample_weights, steps, lr, l2, w, b):
+    """Batch gradient descent in matrix form from (w, b): z = X·w + b, then grad = Xᵀ·((p - y)·sw)."""
+    dot = specialized_dot(len(w))
+    weight_sum = sum(sample_weights)
     inv_n = 1 / weight_sum if weight_sum else 0
+    columns = list(zip(*features))
+    exp = math.exp
     for _ in range(steps):
-        grad_w = [0.0] * m
-        grad_b = 0.0
-        for i in range(n):
-            x = features[i]
-            wi = sample_weights[i] if sample_weights else 1.0
-            z = b + sum(w[j] * x[j] for j in range(m))
-            p = 1 / (1 + math.exp(-z))
-            diff = (p - labels[i]) * wi
-            for j in range(m):
-                grad_w[j] += diff * x[j]
-            grad_b += diff
-        for j in range(m):
-            grad_w[j] = grad_w[j] * inv_n + l2 * w[j]
-            w[j] -= lr * grad_w[j]
-        grad_b *= inv_n
-        b -= lr * grad_b
+        z = [b + dot(w, x) for x in features]
+        diffs = [(1 / (1 + exp(-zi)) - yi) * si for zi, yi, si in zip(z, labels, sample_weights)]
+        grad_w = [sum(map(mul, diffs, col)) for col in columns]
+        w = [wj - lr * (g * inv_n + l2 * wj) for wj, g in zip(w, grad_w)]
+        b -= lr * (sum(diffs) * inv_n)
+    return w, b
+
+
+def train_logistic(features, labels, sample_weights, opts, initial=None):
+    """Fit logistic weights; `initial` ({"w", "b"} of matching width) warm-starts the descent."""
+    if not features or not features[0]:
+        return None
+    m = len(features[0])
+    steps = opts.get("steps", 200)
+    if initial and len(initial["w"]) == m:
+        w, b = list(initial["w"]), initial["b"]
+        steps = opts.get("warmStartSteps", steps)
+    else:
+        w, b = [0.0] * m, 0.0
+    w, b = _train_logistic_kernel(features, labels, sample_weights, steps, opts.get("lr", 0.2), opts.get("l2", 0.01), w, b)
     return {"w": w, "b": b}
 
 
-def stacked_fusion_predict(feature_cache, year, config_idxs, opts):
-    window_start = year - opts.get("windowYears") if opts.get("windowYears") else None
-    train_years = [y for y in feature_cache["scoredYears"] if y < year and (window_start is None or y >= window_start)]
+def stacked_fusion_predict(feature_cache, year, config_idxs, opts, warm_starts=None):
+    train_years = window_scored_years(feature_cache, year, opts.get("windowYears"))
     if len(train_years) < opts.get("minTrain", 12):
         return {"pred": "", "certainty": float("nan"), "used": 0}
     X = []
     y = []
     sample_weights = []
-    lambda_decay = math.log(2) / max(1e-9, opts.get("decayHalfLife", 0)) if opts.get("decayHalfLife") else None
-    for train_year in train_years:
-        feats, used = build_feature_vector(feature_cache, train_year, config_idxs)
+    decay = decay_weights(opts.get("decayHalfLife"), feature_cache["allYears"][-1] - feature_cache["allYears"][0])
+    for train_year, (feats, used) in zip(train_years, build_feature_matrix(feature_cache, train_years, config_idxs)):
         if not used:
             continue
         X.append(feats)
         y.append(feature_cache["labelsByYear"].get(train_year))
-        if lambda_decay is not None:
-            sample_weights.append(math.exp(-lambda_decay * (year - train_year)))
+        sample_weights.append(decay[year - train_year])
     if len(X) < opts.get("minTrain", 12):
         return {"pred": "", "certainty": float("nan"), "used": 0}
-    model = train_logistic(X, y, {**opts, "sampleWeights": sample_weights if lambda_decay is not None else None})
+    warm_key = tuple(config_idxs)
+    initial = warm_starts.get(warm_key) if warm_starts is not None and opts.get("warmStartSteps") else None
+    model = train_logistic(X, y, sample_weights, opts, initial)
     if not model:
         return {"pred": "", "certainty": float("nan"), "used": 0}
+    if warm_starts is not None:
+        warm_starts[warm_key] = model
     feats, used = build_feature_vector(feature_cache, year, config_idxs)
     if not used:
         return {"pred": "", "certainty": float("nan"), "used": 0}
-    z = model["b"] + sum(model["w"][j] * feats[j] for j in range(len(model["w"])))
+    z = model["b"] + specialized_dot(len(model["w"]))(model["w"], feats)
     p = 1 / (1 + math.exp(-z))
     pred = "EARLY_SPRING" if p >= 0.5 else "LONG_WINTER"
     certainty = abs(p - 0.5) * 2
@@ -670,8 +843,7 @@ def stacked_fusion_predict(feature_cache, year, config_idxs, opts):
 
 
 def weighted_blend_predict(feature_cache, year, config_idxs, opts):
-    window_start = year - opts.get("windowYears") if opts.get("windowYears") else None
-    train_years = [y for y in feature_cache["scoredYears"] if y < year and (window_start is None or y >= window_start)]
+    train_years = window_scored_years(feature_cache, year, opts.get("windowYears"))
     if len(train_years) < opts.get("minTrain", 8):
         return {"pred": "", "certainty": float("nan"), "used": 0}
     score = 0.0
@@ -687,11 +859,10 @@ def weighted_blend_predict(feature_cache, year, config_idxs, opts):
         p = (perf["k"] + 2) / (perf["n"] + 4)
         stability_factor = 1 + opts.get("stabilityBoost", 0) * (perf["stability"] - 0.5)
         weight = logit(p) * (1 + math.log1p(perf["n"]) / 3) * stability_factor
-        res = feature_cache["resultsByYear"].get(year, [None])[idx]
-        sig = signal_from_prediction(res)
-        if not sig["signal"]:
+        sign, strength = feature_cache["signalsByYear"][year][idx]
+        if not sign:
             continue
-        score += weight * sig["strength"]
+        score += weight * strength
         total_abs += abs(weight)
         used += 1
     if not total_abs:
@@ -702,9 +873,9 @@ def weighted_blend_predict(feature_cache, year, config_idxs, opts):
     return {"pred": pred, "certainty": certainty, "used": used}
 
 
-def dynamic_super_predict(pred_by_year, year, model):
+def dynamic_super_predict(pred_by_year, year, model, warm_starts=None):
     config_idxs = select_top_config_indexes(model["featureCache"], year, model)
-    res = stacked_fusion_predict(model["featureCache"], year, config_idxs, model["stack"])
+    res = stacked_fusion_predict(model["featureCache"], year, config_idxs, model["stack"], warm_starts)
     method = "stacked"
     used_ratio = res["used"] / len(config_idxs) if config_idxs else 0
     if not res["pred"] or res["certainty"] < model["gate"] or res["used"] < model["minModels"] or used_ratio < model.get("minUsedRatio", 0):
@@ -716,7 +887,7 @@ def dynamic_super_predict(pred_by_year, year, model):
             res = blended
             method = "blend"
     if not res["pred"]:
-        res = majority_vote(pred_by_year.get(year, []))
+        res = majority_vote(pred_by_year.get(year, ((), ()))[1])
         method = "majority"
     return {**res, "method": method}
 
@@ -725,22 +896,28 @@ def backtest_dynamic_super(pred_by_year, outcomes, model):
     k = 0
     n = 0
     last_year = None
+    outcome_by_year = outcomes.get(model["target"], {})
+    # Scored years run in order, so each stacked fit can warm-start from the previous year's fit.
+    warm_starts = {}
     for y in model["featureCache"]["scoredYears"]:
-        res = dynamic_super_predict(pred_by_year, y, model)
+        res = dynamic_super_predict(pred_by_year, y, model, warm_starts)
         if not res["pred"]:
             continue
         n += 1
-        if res["pred"] == outcomes.get(f"{model['target']}:{y}"):
+        if res["pred"] == outcome_by_year.get(y):
             k += 1
         last_year = y
     return {"accuracy": k / n if n else float("nan"), "backtestN": n, "lastYear": last_year}
 
 
 def tune_dynamic_super(pred_by_year, outcomes, feature_cache, tuning_sets):
+    candidates = [
+        {**tuning, "target": feature_cache["target"], "configs": feature_cache["configs"], "featureCache": feature_cache}
+        for tuning in tuning_sets
+    ]
+    backtests = parallel_map(partial(backtest_dynamic_super, pred_by_year, outcomes), candidates)
     best = None
-    for tuning in tuning_sets:
-        candidate = {**tuning, "target": feature_cache["target"], "configs": feature_cache["configs"], "featureCache": feature_cache}
-        backtest = backtest_dynamic_super(pred_by_year, outcomes, candidate)
+    for candidate, backtest in zip(candidates, backtests):
         if not math.isfinite(backtest["accuracy"]):
             continue
         candidate["backtest"] = backtest
@@ -751,20 +928,48 @@ def tune_dynamic_super(pred_by_year, outcomes, feature_cache, tuning_sets):
     return best
 
 
-def build_dynamic_super_model(pred_by_year, outcomes, target, configs, tuning_sets):
-    feature_cache = build_fusion_feature_cache(pred_by_year, outcomes, target, configs, MIN_BACKTEST_GH)
+def load_fusion_feature_cache(pred_by_year, outcomes, target, configs, min_groundhogs, input_digest=None):
+    """Build the feature cache, reusing a pickled copy from FUSION_CACHE_DIR when the inputs are unchanged."""
+    if not input_digest or not FUSION_CACHE_DIR:
+        return build_fusion_feature_cache(pred_by_year, outcomes, target, configs, min_groundhogs)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(input_digest)
+    h.update(Path(__file__).read_bytes())
+    h.update(repr((target, configs, min_groundhogs)).encode("utf-8"))
+    path = Path(FUSION_CACHE_DIR) / f"fusion_{h.hexdigest()}.pkl"
+    try:
+        return pickle.loads(path.read_bytes())
+    except Exception:
+        # Missing, truncated or otherwise unreadable: rebuild and overwrite it.
+        pass
+    feature_cache = build_fusion_feature_cache(pred_by_year, outcomes, target, configs, min_groundhogs)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(feature_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return feature_cache
+
+
+def build_dynamic_super_model(pred_by_year, outcomes, target, configs, tuning_sets, input_digest=None):
+    feature_cache = load_fusion_feature_cache(pred_by_year, outcomes, target, configs, MIN_BACKTEST_GH, input_digest)
     tuned = tune_dynamic_super(pred_by_year, outcomes, feature_cache, tuning_sets)
     return tuned
 
 
 def evaluate(target: str):
-    pred_text = Path("docs/data/predictions.json").read_text()
-    outcomes_text = Path("docs/data/outcomes.csv").read_text()
-    pred_obj = json.loads(pred_text)
-    outcomes_rows = parse_csv(outcomes_text)
+    pred_bytes = Path("docs/data/predictions.json").read_bytes()
+    outcomes_bytes = Path("docs/data/outcomes.csv").read_bytes()
+    pred_obj = json.loads(pred_bytes)
+    outcomes_rows = parse_csv(outcomes_bytes.decode("utf-8"))
     outcomes = index_outcomes(build_outcome_rows(outcomes_rows))
     pred_by_year = index_predictions(pred_obj)
-    model = build_dynamic_super_model(pred_by_year, outcomes, target, FUSION_CONFIGS, TUNING_SETS)
+    input_digest = hashlib.blake2b(pred_bytes + b"\0" + outcomes_bytes, digest_size=16).digest()
+    model = build_dynamic_super_model(pred_by_year, outcomes, target, FUSION_CONFIGS, TUNING_SETS, input_digest)
     if not model:
         return None
     return model
@@ -1,47 +1,60 @@
+import csv
 import os
-from datetime import datetime
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from urllib.request import urlopen
 from urllib.error import HTTPError
 
+# NCEI CAG downloads share the keep-alive pool and ETag cache in _http.
+from _http import conditional_get, http_request
+
 OUT_DIR = Path(__file__).resolve().parents[1] / "docs" / "data"
-END_YEAR = datetime.utcnow().year
+END_YEAR = datetime.now(timezone.utc).year
 START_YEAR = 1887
 
 WINTER_THRESHOLD_F = float(os.environ.get("WINTER_THRESHOLD_F", "1.0"))
 
 
+URL_TMPL = (
+    "https://www.ncei.noaa.gov/access/monitoring/climate-at-a-glance/"
+    "national/time-series/110/tavg/1/{month}/1895-{end_year}/data.csv"
+    "?base_prd=true&begbaseyear=1901&endbaseyear=2000"
+).format
+
+
+@lru_cache(maxsize=16)
 def url_for(month, end_year):
-    return (
-        "https://www.ncei.noaa.gov/access/monitoring/climate-at-a-glance/"
-        f"national/time-series/110/tavg/1/{month}/1895-{end_year}/data.csv"
-        "?base_prd=true&begbaseyear=1901&endbaseyear=2000"
-    )
+    return URL_TMPL(month=month, end_year=end_year)
+
+
+def head_ok(url):
+    """HEAD `url`; only a 404 counts as missing, other errors are left for the GET to report."""
+    try:
+        return 200 <= http_request(url, method="HEAD")[0] < 300
+    except HTTPError as exc:
+        return exc.code != 404
 
 
 def fetch_text(url):
-    with urlopen(url) as resp:
-        return resp.read().decode("utf-8")
+    return conditional_get(url)[0].decode("utf-8")
+
+
+# Any row whose date field starts with a year: captures the year, the value column and, when
+# present, the anomaly column. Header, comment and metadata lines never match.
+ROW_RE = re.compile(r"^[ \t]*(\d{4})[^,\n]*,([^,\n]*)(?:,([^,\n]*))?", re.M)
 
 
 def parse_cag_csv(text):
     rows = {}
-    for line in text.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        parts = [p.strip() for p in line.split(",")]
-        if not parts or parts[0].lower() == "date":
-            continue
-        date_str = parts[0]
-        if len(date_str) < 4 or not date_str[:4].isdigit():
-            continue
-        year = int(date_str[:4])
-        val_str = parts[2] if len(parts) >= 3 and parts[2] else (parts[1] if len(parts) >= 2 else "")
+    for year, value, anomaly in ROW_RE.findall(text):
+        # Prefer the anomaly; rows where it is blank or missing fall back to the value column.
+        val_str = anomaly.strip() or value.strip()
         if not val_str:
             continue
         try:
-            rows[year] = float(val_str)
+            rows[int(year)] = float(val_str)
         except ValueError:
             continue
     return rows
@@ -62,25 +75,45 @@ def winter_bucket_from_mean(mean_anom):
     return "EARLY_WINTER" if mean_anom <= -thr else "NORMAL_WINTER"
 
 
+def outcome_rows(feb, mar, end_year):
+    fmt = "{:.3f}".format
+    for y in range(START_YEAR, end_year + 1):
+        fa = feb.get(y)
+        ma = mar.get(y)
+        mean = None if fa is None or ma is None else (fa + ma) / 2
+        yield (
+            y,
+            "US_CONUS_FEBMAR_MEAN_ANOM",
+            "" if fa is None else fmt(fa),
+            "" if ma is None else fmt(ma),
+            "" if mean is None else fmt(mean),
+            outcome_from_mean(mean),
+            winter_bucket_from_mean(mean),
+        )
+
+
 def main():
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
     end_year = END_YEAR
-    feb_text = None
-    mar_text = None
-    while end_year >= 1895:
-        try:
-            print(f"Fetching NOAA CAG Feb anomalies (end year {end_year})…")
-            feb_text = fetch_text(url_for(2, end_year))
-            print(f"Fetching NOAA CAG Mar anomalies (end year {end_year})…")
-            mar_text = fetch_text(url_for(3, end_year))
-            break
-        except HTTPError as exc:
-            if exc.code != 404:
-                raise
+    # Feb and Mar are independent requests; issue them together so each step costs one round-trip.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # Bodiless HEAD probes skip unpublished end years; a 404 on the GET (e.g. HEAD not
+        # honoured) still falls back a year.
+        while end_year >= 1895:
+            feb_url, mar_url = url_for(2, end_year), url_for(3, end_year)
+            print(f"Probing NOAA CAG endpoints (end year {end_year})…")
+            if all(pool.map(head_ok, (feb_url, mar_url))):
+                try:
+                    print(f"Fetching NOAA CAG Feb and Mar anomalies (end year {end_year})…")
+                    feb_text, mar_text = pool.map(fetch_text, (feb_url, mar_url))
+                    break
+                except HTTPError as exc:
+                    if exc.code != 404:
+                        raise
             end_year -= 1
-    if feb_text is None or mar_text is None:
-        raise RuntimeError("Could not resolve a valid NOAA CAG endpoint.")
+        else:
+            raise RuntimeError("Could not resolve a valid NOAA CAG endpoint.")
 
     feb = parse_cag_csv(feb_text)
     mar = parse_cag_csv(mar_text)
@@ -93,27 +126,10 @@ def main():
     )
     lines.append("year,target,feb_anom,mar_anom,mean_anom,outcome,winter_bucket")
 
-    for y in range(START_YEAR, end_year + 1):
-        fa = feb.get(y)
-        ma = mar.get(y)
-        if fa is None or ma is None:
-            mean = None
-        else:
-            mean = (fa + ma) / 2
-        out = outcome_from_mean(mean)
-        wb = winter_bucket_from_mean(mean)
-        lines.append(",".join([
-            str(y),
-            "US_CONUS_FEBMAR_MEAN_ANOM",
-            f"{fa:.3f}" if fa is not None else "",
-            f"{ma:.3f}" if ma is not None else "",
-            f"{mean:.3f}" if mean is not None else "",
-            out,
-            wb
-        ]))
-
     out_path = OUT_DIR / "outcomes.csv"
-    out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with out_path.open("w", encoding="utf-8", newline="") as f:
+        f.writelines(line + "\n" for line in lines)
+        csv.writer(f, lineterminator="\n").writerows(outcome_rows(feb, mar, end_year))
     print(f"✓ wrote {out_path.relative_to(Path.cwd())}")
 
 
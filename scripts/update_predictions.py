@@ -1,79 +1,195 @@
+import hashlib
+import http.client
 import json
+import os
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from collections import Counter, namedtuple
+from operator import attrgetter
 from pathlib import Path
-from urllib.request import Request, urlopen
+from urllib.error import HTTPError
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+# groundhog-day.com requests share the keep-alive pool and ETag cache in _http.
+from _http import HTTP_CACHE_DIR, cache_paths, conditional_get, write_atomic
+
+try:
+    # Optional: orjson decodes the bodies several times faster than the stdlib parser.
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 API = "https://groundhog-day.com/api/v1"
 OUT_DIR = Path(__file__).resolve().parents[1] / "docs" / "data"
 
 START_YEAR = 1887
-END_YEAR = datetime.utcnow().year
+END_YEAR = datetime.now(timezone.utc).year
+CURRENT_YEAR_TTL = 3600
+# Opt-in: serve finished years from cache for this many seconds without revalidating. The default 0
+# sends a conditional GET for every past year, so upstream corrections show up on the next run.
+SETTLED_YEAR_TTL = int(os.environ.get("SETTLED_YEAR_TTL", "0"))
+# Year fetches are I/O-bound, so far more threads than cores pay off.
+PREDICTION_WORKERS = int(os.environ.get("PREDICTION_WORKERS", "20"))
+# Per-year prediction counts from the last complete run; a ranged batch must cover all of them.
+COUNTS_PATH = Path(HTTP_CACHE_DIR) / "prediction_counts.json" if HTTP_CACHE_DIR else None
+# Predictions are carried as tuples and only become dicts (in this field order) when written.
+Prediction = namedtuple("Prediction", ("year", "shadow", "groundhogSlug", "groundhogName", "details", "source"))
 
 
 def sleep(ms):
     time.sleep(ms / 1000)
 
 
-def fetch_json(url, tries=3, timeout=30):
+JSON_HEADERS = {"accept": "application/json"}
+
+
+def fetch_body(url, tries=3, timeout=30, ttl=None):
+    """Fetch `url` through the conditional-GET cache with retries; returns (body, modified)."""
     last_err = None
     for i in range(tries):
         try:
-            req = Request(url, headers={"accept": "application/json"})
-            with urlopen(req, timeout=timeout) as resp:
-                return json.load(resp)
+            return conditional_get(url, headers=JSON_HEADERS, ttl=ttl, timeout=timeout)
         except Exception as exc:
             last_err = exc
             sleep(250 * (i + 1))
     raise last_err
 
 
+def fetch_json(url, tries=3, timeout=30, ttl=None):
+    return json_loads(fetch_body(url, tries, timeout, ttl)[0])
+
+
+def predictions_from_rows(rows, default_year=None):
+    preds = []
+    for r in rows or []:
+        g = r.get("groundhog") or {}
+        preds.append(Prediction(
+            year=r.get("year", default_year),
+            shadow=bool(r.get("shadow")),
+            groundhogSlug=g.get("slug"),
+            groundhogName=g.get("name"),
+            details=r.get("details"),
+            source=r.get("source") or g.get("source")
+        ))
+    return preds
+
+
+def year_counts(predictions):
+    return Counter(p.year for p in predictions if isinstance(p.year, int) and p.groundhogSlug)
+
+
+def load_year_counts():
+    if COUNTS_PATH is None:
+        return {}
+    try:
+        return {int(y): n for y, n in json.loads(COUNTS_PATH.read_text(encoding="utf-8")).items()}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def save_year_counts(counts):
+    if COUNTS_PATH is None:
+        return
+    COUNTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(COUNTS_PATH, json.dumps({str(y): n for y, n in sorted(counts.items())}).encode("utf-8"))
+
+
+def fetch_range(start_year, end_year, known_counts):
+    """Try one ranged /predictions query; None unless it provably covers every year in range."""
+    url = f"{API}/predictions?startYear={start_year}&endYear={end_year}"
+    try:
+        data = fetch_json(url, tries=1, ttl=CURRENT_YEAR_TTL)
+    except (HTTPError, OSError, ValueError, http.client.HTTPException):
+        return None
+    rows = data.get("predictions") if isinstance(data, dict) else None
+    if not isinstance(rows, list):
+        return None
+    preds = predictions_from_rows(rows)
+    if any(not isinstance(p.year, int) or not start_year <= p.year <= end_year for p in preds):
+        return None
+    counts = year_counts(preds)
+    if not counts or min(counts) != start_year:
+        return None
+    if known_counts:
+        if any(counts.get(y, 0) < n for y, n in known_counts.items() if start_year <= y <= end_year):
+            return None
+    elif max(counts) != end_year:
+        return None
+    return preds
+
+
 def main():
     OUT_DIR.mkdir(parents=True, exist_ok=True)
+    updated_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
-    print(f"Fetching groundhog list from {API}/groundhogs ...")
-    gh = fetch_json(f"{API}/groundhogs")
-    if isinstance(gh, dict):
-        groundhogs = gh.get("groundhogs") or []
-    elif isinstance(gh, list):
-        groundhogs = gh
-    else:
+    groundhogs_url = f"{API}/groundhogs"
+    print(f"Fetching groundhog list from {groundhogs_url} ...")
+    body, modified = fetch_body(groundhogs_url)
+    # The directory projection and inline-predictions marker are kept beside the cached body, keyed
+    # by its digest, so an unchanged (304) list without embedded predictions is never decoded again.
+    shape_path = cache_paths(groundhogs_url)[0].with_suffix(".shape.json") if HTTP_CACHE_DIR else None
+    digest = hashlib.sha1(body).hexdigest()
+    shape = None
+    if shape_path and not modified:
+        try:
+            shape = json.loads(shape_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            shape = None
+        if shape and shape.get("digest") != digest:
+            shape = None
+
+    if shape and not shape.get("hasInline"):
+        print("Groundhog list unchanged; reusing cached directory.")
         groundhogs = []
+        groundhog_dir = shape["groundhogs"]
+        has_inline = False
+    else:
+        gh = json_loads(body)
+        if isinstance(gh, dict):
+            groundhogs = gh.get("groundhogs") or []
+        elif isinstance(gh, list):
+            groundhogs = gh
+        else:
+            groundhogs = []
 
-    if not groundhogs:
-        raise RuntimeError("Unexpected /groundhogs response shape; got no groundhogs.")
-
-    groundhog_dir = []
-    for g in groundhogs:
-        slug = g.get("slug")
-        if not slug:
-            continue
-        groundhog_dir.append({
-            "id": g.get("id"),
-            "slug": slug,
-            "name": g.get("name"),
-            "shortName": g.get("shortName"),
-            "region": g.get("region"),
-            "country": g.get("country"),
-            "state": g.get("state"),
-            "city": g.get("city"),
-            "latitude": g.get("latitude"),
-            "longitude": g.get("longitude"),
-            "source": g.get("source"),
-            "predictionsCount": g.get("predictionsCount")
-        })
+        if not groundhogs:
+            raise RuntimeError("Unexpected /groundhogs response shape; got no groundhogs.")
 
+        groundhog_dir = [
+            {
+                "id": g.get("id"),
+                "slug": g["slug"],
+                "name": g.get("name"),
+                "shortName": g.get("shortName"),
+                "region": g.get("region"),
+                "country": g.get("country"),
+                "state": g.get("state"),
+                "city": g.get("city"),
+                "latitude": g.get("latitude"),
+                "longitude": g.get("longitude"),
+                "source": g.get("source"),
+                "predictionsCount": g.get("predictionsCount")
+            }
+            for g in groundhogs if g.get("slug")
+        ]
+        has_inline = any(isinstance(g.get("predictions"), list) and g.get("predictions") for g in groundhogs)
+        if shape_path:
+            write_atomic(shape_path, json.dumps({
+                "digest": digest,
+                "hasInline": has_inline,
+                "groundhogs": groundhog_dir
+            }).encode("utf-8"))
+
+    # Encode in one pass and write once; json.dump(indent=...) issues a write per token.
     groundhog_path = OUT_DIR / "groundhogs.json"
-    with groundhog_path.open("w", encoding="utf-8") as f:
-        json.dump({
-            "updatedAt": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
-            "groundhogs": groundhog_dir
-        }, f, indent=2)
+    groundhog_path.write_text(json.dumps({
+        "updatedAt": updated_at,
+        "groundhogs": groundhog_dir
+    }, indent=2), encoding="utf-8")
 
-    has_inline = any(isinstance(g.get("predictions"), list) and g.get("predictions") for g in groundhogs)
     predictions = []
+    errors = 0
 
     if has_inline:
         print("Found predictions embedded in /groundhogs response. Extracting...")
@@ -81,66 +197,61 @@ def main():
             preds = g.get("predictions")
             if not isinstance(preds, list):
                 continue
-            for p in preds:
-                predictions.append({
-                    "year": p.get("year"),
-                    "shadow": bool(p.get("shadow")),
-                    "groundhogSlug": g.get("slug"),
-                    "groundhogName": g.get("name"),
-                    "details": p.get("details"),
-                    "source": p.get("source") or g.get("source")
-                })
+            slug, name, source = g.get("slug"), g.get("name"), g.get("source")
+            predictions.extend(Prediction(
+                year=p.get("year"),
+                shadow=bool(p.get("shadow")),
+                groundhogSlug=slug,
+                groundhogName=name,
+                details=p.get("details"),
+                source=p.get("source") or source
+            ) for p in preds)
     else:
-        print("No embedded predictions found. Pulling per-year predictions...")
-        years = list(range(START_YEAR, END_YEAR + 1))
-
-        def fetch_year(y):
-            url = f"{API}/predictions?year={y}"
-            data = fetch_json(url)
-            rows = data.get("predictions") if isinstance(data, dict) else []
-            preds = []
-            for r in rows or []:
-                g = r.get("groundhog") or {}
-                preds.append({
-                    "year": r.get("year", y),
-                    "shadow": bool(r.get("shadow")),
-                    "groundhogSlug": g.get("slug"),
-                    "groundhogName": g.get("name"),
-                    "details": r.get("details"),
-                    "source": r.get("source") or g.get("source")
-                })
-            return preds
-
-        errors = 0
-        with ThreadPoolExecutor(max_workers=6) as pool:
-            future_map = {pool.submit(fetch_year, y): y for y in years}
-            for fut in as_completed(future_map):
-                y = future_map[fut]
-                try:
-                    predictions.extend(fut.result())
-                    sys.stdout.write(".")
-                    sys.stdout.flush()
-                except Exception as exc:
-                    errors += 1
-                    sys.stderr.write(f"\n⚠️  {y}: {exc}\n")
-            sys.stdout.write("\n")
-
-        if errors:
-            print(f"Completed with {errors} failed year(s).", file=sys.stderr)
-
-    predictions = [
-        p for p in predictions
-        if isinstance(p.get("year"), int) and p.get("groundhogSlug")
-    ]
-    predictions.sort(key=lambda p: (p["year"], p["groundhogSlug"]))
+        print("No embedded predictions found. Trying a ranged predictions query...")
+        batch = fetch_range(START_YEAR, END_YEAR, load_year_counts())
+        if batch is not None:
+            predictions.extend(batch)
+        else:
+            print("Range query unsupported or incomplete. Pulling per-year predictions...")
+
+            def fetch_year(y):
+                url = f"{API}/predictions?year={y}"
+                # Past years are revalidated with a conditional GET; the live year is re-polled hourly at most.
+                data = fetch_json(url, ttl=CURRENT_YEAR_TTL if y == END_YEAR else (SETTLED_YEAR_TTL or None))
+                rows = data.get("predictions") if isinstance(data, dict) else []
+                return predictions_from_rows(rows, y)
+
+            years = range(START_YEAR, END_YEAR + 1)
+            with ThreadPoolExecutor(max_workers=min(PREDICTION_WORKERS, len(years))) as pool:
+                future_map = {pool.submit(fetch_year, y): y for y in years}
+                for fut in as_completed(future_map):
+                    y = future_map[fut]
+                    try:
+                        predictions.extend(fut.result())
+                        sys.stdout.write(".")
+                        sys.stdout.flush()
+                    except Exception as exc:
+                        errors += 1
+                        sys.stderr.write(f"\n⚠️  {y}: {exc}\n")
+                sys.stdout.write("\n")
+
+            if errors:
+                print(f"Completed with {errors} failed year(s).", file=sys.stderr)
+
+    predictions = sorted(
+        (p for p in predictions if isinstance(p.year, int) and p.groundhogSlug),
+        key=attrgetter("year", "groundhogSlug"),
+    )
+
+    if not errors:
+        save_year_counts(year_counts(predictions))
 
     print(f"Writing {len(predictions):,} predictions...")
     pred_path = OUT_DIR / "predictions.json"
-    with pred_path.open("w", encoding="utf-8") as f:
-        json.dump({
-            "updatedAt": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
-            "predictions": predictions
-        }, f, indent=2)
+    pred_path.write_text(json.dumps({
+        "updatedAt": updated_at,
+        "predictions": [p._asdict() for p in predictions]
+    }, indent=2), encoding="utf-8")
 
     print("✓ done")
 
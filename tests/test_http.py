@@ -0,0 +1,111 @@
+import gzip
+import sys
+import tempfile
+import threading
+import unittest
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import _http  # noqa: E402
+
+PAYLOAD = b"year,value\n2025,1.5\n" * 20
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    log = []
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def handle_any(self):
+        self.log.append((self.command, self.path, self.headers.get("If-None-Match")))
+        if self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.reply(304, headers=[("ETag", '"v1"')])
+            else:
+                self.reply(200, PAYLOAD, [("ETag", '"v1"')])
+        elif self.path == "/see-other":
+            self.reply(303, headers=[("Location", "/target")])
+        elif self.path == "/target":
+            self.reply(200, self.command.encode("ascii"))
+        elif self.path == "/gzip":
+            self.reply(200, gzip.compress(PAYLOAD), [("Content-Encoding", "gzip")])
+        elif self.path == "/raw-deflate":
+            raw = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+            self.reply(200, raw.compress(PAYLOAD) + raw.flush(), [("Content-Encoding", "deflate")])
+        else:
+            self.reply(404)
+
+    do_GET = do_HEAD = do_POST = handle_any
+
+
+class HttpTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        for conn in getattr(_http._pool, "conns", {}).values():
+            conn.close()
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        Handler.log.clear()
+        cache = tempfile.TemporaryDirectory()
+        self.addCleanup(cache.cleanup)
+        patcher = mock.patch.object(_http, "HTTP_CACHE_DIR", cache.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_conditional_get_reuses_body_on_304(self):
+        url = self.base + "/etag"
+        self.assertEqual(_http.conditional_get(url), (PAYLOAD, True))
+        self.assertEqual(_http.conditional_get(url), (PAYLOAD, False))
+        self.assertEqual([entry[2] for entry in Handler.log], [None, '"v1"'])
+
+    def test_ttl_skips_revalidation(self):
+        url = self.base + "/etag"
+        _http.conditional_get(url, ttl=60)
+        self.assertEqual(_http.conditional_get(url, ttl=60), (PAYLOAD, False))
+        self.assertEqual(len(Handler.log), 1)
+
+    def test_see_other_is_fetched_with_get(self):
+        status, _, body = _http.http_request(self.base + "/see-other", method="POST")
+        self.assertEqual((status, body), (200, b"GET"))
+        self.assertEqual(Handler.log[-1][:2], ("GET", "/target"))
+
+    def test_see_other_keeps_head(self):
+        status, _, body = _http.http_request(self.base + "/see-other", method="HEAD")
+        self.assertEqual((status, body), (200, b""))
+        self.assertEqual(Handler.log[-1][:2], ("HEAD", "/target"))
+
+    def test_decodes_gzip(self):
+        self.assertEqual(_http.http_request(self.base + "/gzip")[2], PAYLOAD)
+
+    def test_decodes_raw_deflate(self):
+        self.assertEqual(_http.http_request(self.base + "/raw-deflate")[2], PAYLOAD)
+
+    def test_decode_body_leaves_empty_bodies(self):
+        self.assertEqual(_http.decode_body(b"", "gzip"), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
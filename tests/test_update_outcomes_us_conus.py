@@ -0,0 +1,40 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from update_outcomes_us_conus import parse_cag_csv  # noqa: E402
+
+MIXED_BODY = (
+    "Contiguous U.S., Average Temperature, February\n"
+    "Units: Degrees Fahrenheit\n"
+    "Base Period: 1901-2000\n"
+    "# Missing: -99\n"
+    "Date,Value,Anomaly\n"
+    "189502,30.12,\n"
+    "189602,31.00,-1.50\n"
+    "189702,29.5\n"
+    "189802 , 28.0 , 0.25 \r\n"
+    "189902,,\n"
+    "190002,27.1,N/A\n"
+    "1901-02,26.4,-0.75\n"
+)
+
+
+class ParseCagCsvTest(unittest.TestCase):
+    def test_mixed_body_falls_back_per_row(self):
+        self.assertEqual(parse_cag_csv(MIXED_BODY), {
+            1895: 30.12,  # blank anomaly -> value column
+            1896: -1.5,
+            1897: 29.5,  # no anomaly column -> value column
+            1898: 0.25,
+            1901: -0.75,
+        })
+
+    def test_headers_only(self):
+        self.assertEqual(parse_cag_csv("Date,Value,Anomaly\n# nothing yet\n"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()